@@ -1,19 +1,25 @@
 #!/usr/bin/env python3
+from collections import Counter
+
+_ASCII_LOWER = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+                               b"abcdefghijklmnopqrstuvwxyz")
+_ASCII_NON_LETTERS = bytes(c for c in range(128) if not chr(c).isalpha())
+
+
 def main():
     book_path = "books/frankenstein.txt"
     text = get_book_text(book_path)
     num_words = get_num_words(text)
     counting_characters = count_characters(text)
     print(f"{num_words} words found in the document")
-    print(f"{counting_characters} characters found")
+    print(f"{sum(counting_characters.values())} characters found")
 
-    # Sort and print character frequencies
-    # Sorting the characters by their counts in descending order
-    sorted_characters = sorted(counting_characters.items(), key=lambda pair: pair[1], reverse=True)
-
-    # Go through each character and its count in the sorted list
-    for char, count in sorted_characters:
-        print("The '" + char + "' character was found " + str(count) + " times")
+    # Print character frequencies, most common first, in a single write
+    if counting_characters:
+        print("\n".join(
+            f"The '{char}' character was found {count} times"
+            for char, count in counting_characters.most_common()
+        ))
 
 def get_num_words(text):
     words = text.split()
@@ -21,23 +27,17 @@ def get_num_words(text):
 
 
 def get_book_text(path):
-    with open(path) as f:
-        return f.read()
+    with open(path, "rb", buffering=1 << 16) as f:
+        return f.read().decode("utf-8", errors="replace")
 
 def count_characters(text):
-    text = text.lower()
-    spliting = text.split()
-    char_count = {}
-
-    for char in spliting:
-        if char.isalpha():
-            if char in char_count:
-                char_count[char] += 1
-            else:
-                char_count[char] = 1
-    return char_count
+    # Plain ASCII books can be lowercased and stripped of non-letters in C
+    if text.isascii():
+        letters = text.encode("ascii").translate(_ASCII_LOWER, _ASCII_NON_LETTERS)
+        return Counter(letters.decode("ascii"))
+    return Counter(filter(str.isalpha, text.lower()))
 
 
-    
-main()
+if __name__ == "__main__":
+    main()
 